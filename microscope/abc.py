@@ -22,8 +22,8 @@
 """
 
 import abc
+import copy
 import functools
-import itertools
 import logging
 import queue
 import threading
@@ -70,7 +70,9 @@ class _Setting:
         get_func: a function to get the current value.
         set_func: a function to set the value.
         values: a description of allowed values dependent on dtype, or
-            function that returns a description.
+            function that returns a description.  Unless it is a
+            function, it is only read once, at construction, so later
+            changes to it are not reflected.
         readonly: an optional function to indicate if the setting is
             readonly.  A setting may be readonly temporarily, so this
             function will return `True` or `False` to indicate its
@@ -95,16 +97,37 @@ class _Setting:
 
     """
 
+    # There is one instance for each setting of each device, so avoid
+    # a __dict__ per instance.
+    __slots__ = (
+        "name",
+        "dtype",
+        "_get",
+        "_set",
+        "_values",
+        "_values_are_enum",
+        "_values_are_dynamic",
+        "_constant_values",
+        "_readonly",
+        "_last_written",
+    )
+
     def __init__(
         self,
         name: str,
         dtype: str,
-        get_func: typing.Optional[typing.Callable[[], typing.Any]],
+        get_func: typing.Callable[[], typing.Any],
         set_func: typing.Optional[typing.Callable[[typing.Any], None]] = None,
         values: typing.Any = None,
         readonly: typing.Optional[typing.Callable[[], bool]] = None,
     ) -> None:
         self.name = name
+        # Only write-only settings, which return the value last
+        # written, do not have a get function.
+        if get_func is None and not isinstance(self, _WriteOnlySetting):
+            raise ValueError(
+                "`get_func` is `None`, use a write-only setting instead"
+            )
         if dtype not in DTYPES:
             raise ValueError("Unsupported dtype.")
         elif not (isinstance(values, DTYPES[dtype]) or callable(values)):
@@ -115,16 +138,11 @@ class _Setting:
         self.dtype = dtype
         self._get = get_func
         self._values = values
+        # Settings whose values are an Enum get and set the Enum
+        # value instead of the Enum instance.
+        self._values_are_enum = isinstance(values, EnumMeta)
         self._last_written = None
-        if self._get is not None:
-            self._set = set_func
-        else:
-            # Cache last written value for write-only settings.
-            def w(value):
-                self._last_written = value
-                set_func(value)
-
-            self._set = w
+        self._set = set_func
 
         if readonly is None:
             if self._set is None:
@@ -139,6 +157,15 @@ class _Setting:
             else:
                 self._readonly = readonly
 
+        # Unless they come from a function, the allowed values never
+        # change so only build their description once.  EnumMeta are
+        # callable but also constant.
+        self._values_are_dynamic = (
+            callable(values) and not self._values_are_enum
+        )
+        if not self._values_are_dynamic:
+            self._constant_values = self._describe_values()
+
     def describe(self):
         return {
             "type": self.dtype,
@@ -148,11 +175,8 @@ class _Setting:
         }
 
     def get(self):
-        if self._get is not None:
-            value = self._get()
-        else:
-            value = self._last_written
-        if isinstance(self._values, EnumMeta):
+        value = self._get()
+        if self._values_are_enum:
             return self._values(value).value
         else:
             return value
@@ -165,12 +189,19 @@ class _Setting:
         if self._set is None:
             raise NotImplementedError()
         # TODO further validation.
-        if isinstance(self._values, EnumMeta):
+        if self._values_are_enum:
             value = self._values(value)
         self._set(value)
 
     def values(self):
-        if isinstance(self._values, EnumMeta):
+        if self._values_are_dynamic:
+            return self._describe_values()
+        else:
+            # Return a copy so callers can't modify the cached list.
+            return copy.copy(self._constant_values)
+
+    def _describe_values(self):
+        if self._values_are_enum:
             return [(v.value, v.name) for v in self._values]
         values = _call_if_callable(self._values)
         if values is not None:
@@ -184,6 +215,62 @@ class _Setting:
                 return values
 
 
+class _WriteOnlySetting(_Setting):
+    """A setting without a get function.
+
+    The value last written is cached and returned by `get`.  Takes the
+    same arguments as `_Setting` except `get_func`.
+
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        name: str,
+        dtype: str,
+        set_func: typing.Optional[typing.Callable[[typing.Any], None]] = None,
+        values: typing.Any = None,
+        readonly: typing.Optional[typing.Callable[[], bool]] = None,
+    ) -> None:
+        super().__init__(name, dtype, None, set_func, values, readonly)
+
+    def get(self):
+        value = self._last_written
+        if self._values_are_enum:
+            return self._values(value).value
+        else:
+            return value
+
+    def set(self, value) -> None:
+        """Set a setting and cache its value."""
+        if self._set is None:
+            raise NotImplementedError()
+        if self._values_are_enum:
+            value = self._values(value)
+        self._last_written = value
+        self._set(value)
+
+
+def _make_setting(
+    name: str,
+    dtype: str,
+    get_func: typing.Optional[typing.Callable[[], typing.Any]],
+    set_func: typing.Optional[typing.Callable[[typing.Any], None]] = None,
+    values: typing.Any = None,
+    readonly: typing.Optional[typing.Callable[[], bool]] = None,
+) -> _Setting:
+    """Create a setting.
+
+    Takes the same arguments as `_Setting`.  If `get_func` is `None`,
+    returns a write-only setting (see `_WriteOnlySetting`).
+    """
+    if get_func is None:
+        return _WriteOnlySetting(name, dtype, set_func, values, readonly)
+    else:
+        return _Setting(name, dtype, get_func, set_func, values, readonly)
+
+
 class FloatingDeviceMixin(metaclass=abc.ABCMeta):
     """A mixin for devices that 'float'.
 
@@ -413,7 +500,10 @@ class Device(metaclass=abc.ABCMeta):
             get_func: a function to get the current value.
             set_func: a function to set the value.
             values: a description of allowed values dependent on
-                dtype, or function that returns a description.
+                dtype, or function that returns a description.  Unless
+                it is a function, it is only read once, when the
+                setting is added, so later changes to it are not
+                reflected.
             readonly: an optional function to indicate if the setting
                 is readonly.  A setting may be readonly temporarily,
                 so this function will return `True` or `False` to
@@ -439,7 +529,7 @@ class Device(metaclass=abc.ABCMeta):
                 % (dtype, name, DTYPES[dtype])
             )
         else:
-            self._settings[name] = _Setting(
+            self._settings[name] = _make_setting(
                 name, dtype, get_func, set_func, values, readonly
             )
 
@@ -453,17 +543,17 @@ class Device(metaclass=abc.ABCMeta):
 
     def get_all_settings(self):
         """Return ordered settings as a list of dicts."""
-
-        # Fetching some settings may fail depending on device state.
-        # Report these values as 'None' and continue fetching other settings.
-        def catch(f):
+        values = {}
+        for name, setting in self._settings.items():
+            # Fetching some settings may fail depending on device
+            # state.  Report these values as 'None' and continue
+            # fetching other settings.
             try:
-                return f()
+                values[name] = setting.get()
             except Exception as err:
-                _logger.error("getting %s: %s", f.__self__.name, err)
-                return None
-
-        return {k: catch(v.get) for k, v in self._settings.items()}
+                _logger.error("getting %s: %s", name, err)
+                values[name] = None
+        return values
 
     def set_setting(self, name: str, value) -> None:
         """Set a setting."""
@@ -483,10 +573,11 @@ class Device(metaclass=abc.ABCMeta):
 
     def update_settings(self, incoming, init: bool = False):
         """Update settings based on dict of settings and values."""
+        settings = self._settings
+        my_keys = set(settings.keys())
+        their_keys = set(incoming.keys())
         if init:
             # Assume nothing about state: set everything.
-            my_keys = set(self._settings.keys())
-            their_keys = set(incoming.keys())
             update_keys = my_keys & their_keys
             if update_keys != my_keys:
                 missing = ", ".join([k for k in my_keys - their_keys])
@@ -497,27 +588,27 @@ class Device(metaclass=abc.ABCMeta):
                 raise Exception(msg)
         else:
             # Only update changed values.
-            my_keys = set(self._settings.keys())
-            their_keys = set(incoming.keys())
-            update_keys = set(
+            update_keys = [
                 key
                 for key in my_keys & their_keys
-                if self.get_setting(key) != incoming[key]
-            )
+                if settings[key].get() != incoming[key]
+            ]
         results = {}
+        # Keys to read back after all values have been updated.
+        to_read = []
         # Update values.
         for key in update_keys:
-            if key not in my_keys or not self._settings[key].set:
+            if key not in my_keys or not settings[key].set:
                 # Setting not recognised or no set function implemented
                 results[key] = NotImplemented
-                update_keys.remove(key)
                 continue
-            if self._settings[key].readonly():
+            to_read.append(key)
+            if settings[key].readonly():
                 continue
-            self._settings[key].set(incoming[key])
+            settings[key].set(incoming[key])
         # Read back values in second loop.
-        for key in update_keys:
-            results[key] = self._settings[key].get()
+        for key in to_read:
+            results[key] = settings[key].get()
         return results
 
 
@@ -564,8 +655,13 @@ class DataDevice(Device, metaclass=abc.ABCMeta):
         self._fetch_thread_run = False
         # A flag to indicate that this class uses a fetch callback.
         self._using_callback = False
+        # An event to wake up the _fetch_thread when new data may be
+        # available (see _fetch_data).
+        self._data_ready = threading.Event()
         # Clients to which we send data.
         self._clientStack = []
+        # The client at the top of the stack, None if stack is empty.
+        self._current_client = None
         # A set of live clients to avoid repeated dispatch to disconnected client.
         self._liveClients = set()
         # A thread to dispatch data.
@@ -641,6 +737,7 @@ class DataDevice(Device, metaclass=abc.ABCMeta):
             if self._fetch_thread.is_alive():
                 _logger.debug("Found fetch thread alive. Joining.")
                 self._fetch_thread_run = False
+                self._data_ready.set()
                 self._fetch_thread.join()
             _logger.debug("Fetch thread is dead.")
         super().disable()
@@ -656,6 +753,12 @@ class DataDevice(Device, metaclass=abc.ABCMeta):
         function can just return a reference to the object.  If no
         data is available, return `None`.
 
+        When this returns `None`, the fetch thread waits for a short
+        period before polling again.  Devices that know when new data
+        arrives, for example on a callback or after a software
+        trigger, should call ``self._data_ready.set()`` to wake up the
+        fetch thread immediately.
+
         """
         raise NotImplementedError()
 
@@ -682,11 +785,16 @@ class DataDevice(Device, metaclass=abc.ABCMeta):
             Pyro4.errors.CommunicationError,
         ):
             # Client not listening
-            _logger.info(
-                "Removing %s from client stack: disconnected.", client._pyroUri
-            )
-            self._clientStack = list(filter(client.__ne__, self._clientStack))
-            self._liveClients = self._liveClients.difference([client])
+            self._drop_client(client)
+
+    def _drop_client(self, client) -> None:
+        """Remove all instances of a disconnected client from the stack."""
+        _logger.info(
+            "Removing %s from client stack: disconnected.", client._pyroUri
+        )
+        self._clientStack = [c for c in self._clientStack if c != client]
+        self._liveClients.discard(client)
+        self._current_client = (self._clientStack or [None])[-1]
 
     def _dispatch_loop(self) -> None:
         """Process data and send results to any client."""
@@ -721,6 +829,9 @@ class DataDevice(Device, metaclass=abc.ABCMeta):
         self._fetch_thread_run = True
 
         while self._fetch_thread_run:
+            # Clear before fetching so that we don't miss data that
+            # arrives while we are fetching.
+            self._data_ready.clear()
             _logger.debug("Fetching data from device.")
             try:
                 data = self._fetch_data()
@@ -738,25 +849,29 @@ class DataDevice(Device, metaclass=abc.ABCMeta):
                 self._put(data, timestamp)
             else:
                 _logger.debug("Fetched no data from device.")
-                time.sleep(0.001)
+                self._data_ready.wait(timeout=0.001)
 
     @property
     def _client(self):
         """A getter for the current client."""
-        return (self._clientStack or [None])[-1]
+        return self._current_client
 
     @_client.setter
     def _client(self, val):
         """Push or pop a client from the _clientStack."""
         if val is None:
-            self._clientStack.pop()
+            popped = self._clientStack.pop()
+            # The same client may have been pushed more than once.
+            if popped not in self._clientStack:
+                self._liveClients.discard(popped)
         else:
             self._clientStack.append(val)
-        self._liveClients = set(self._clientStack)
+            self._liveClients.add(val)
+        self._current_client = (self._clientStack or [None])[-1]
 
     def _put(self, data, timestamp) -> None:
         """Put data and timestamp into dispatch buffer with target dispatch client."""
-        self._dispatch_buffer.put((self._client, data, timestamp))
+        self._dispatch_buffer.put((self._current_client, data, timestamp))
 
     def set_client(self, new_client) -> None:
         """Set up a connection to our client.
@@ -845,24 +960,37 @@ class Camera(TriggerTargetMixin, DataDevice):
         self._client_transform = (False, False, False)
         # Result of combining client and readout transforms
         self._transform = (False, False, False)
+        # Function that applies self._transform to data.
+        self._transform_data = self._make_transform_function(self._transform)
         self.add_setting("roi", "tuple", self.get_roi, self.set_roi, None)
 
+    @staticmethod
+    def _make_transform_function(
+        transform: typing.Tuple[bool, bool, bool]
+    ) -> typing.Callable[[numpy.ndarray], numpy.ndarray]:
+        """Return function that applies transform `(lr, ud, rot)` to data.
+
+        The rotation is done first and then the flips, same as
+        `numpy.rot90` followed by `numpy.fliplr` and `numpy.flipud`.
+        Both rotation and flips only change the strides of the array
+        so the function always returns a view of the data.
+        """
+        lr, ud, rot = transform
+        if not (lr or ud or rot):
+            return lambda data: data
+        flips = (
+            slice(None, None, -1 if ud else 1),
+            slice(None, None, -1 if lr else 1),
+        )
+        if rot:
+            # Same as numpy.rot90(data, 1)
+            return lambda data: data[:, ::-1].swapaxes(0, 1)[flips]
+        else:
+            return lambda data: data[flips]
+
     def _process_data(self, data):
         """Apply self._transform to data."""
-        flips = (self._transform[0], self._transform[1])
-        rot = self._transform[2]
-
-        # Choose appropriate transform based on (flips, rot).
-        # Do rotation
-        data = numpy.rot90(data, rot)
-        # Flip
-        data = {
-            (0, 0): lambda d: d,
-            (0, 1): numpy.flipud,
-            (1, 0): numpy.fliplr,
-            (1, 1): lambda d: numpy.fliplr(numpy.flipud(d)),
-        }[flips](data)
-        return super()._process_data(data)
+        return super()._process_data(self._transform_data(data))
 
     def get_transform(self) -> typing.Tuple[bool, bool, bool]:
         """Return the current transform without readout transform."""
@@ -878,6 +1006,7 @@ class Camera(TriggerTargetMixin, DataDevice):
             lr = not lr
             ud = not ud
         self._transform = (lr, ud, rot)
+        self._transform_data = self._make_transform_function(self._transform)
 
     def set_transform(self, transform: typing.Tuple[bool, bool, bool]) -> None:
         """Set client transform and update resultant transform."""
@@ -1032,7 +1161,7 @@ class SerialDeviceMixin(metaclass=abc.ABCMeta):
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
             with self._comms_lock:
-                self.connection.flushInput()
+                self.connection.reset_input_buffer()
                 return func(self, *args, **kwargs)
 
         return wrapper
@@ -49,7 +49,7 @@ class TrgSourceMap(enum.Enum):
 
 class PiCamera(microscope.abc.Camera):
     def __init__(self, *args, **kwargs):
-        super(PiCamera, self).__init__(**kwargs)
+        super().__init__(**kwargs)
         # example parameter to allow setting.
         #        self.add_setting('_error_percent', 'int',
         #                         lambda: self._error_percent,
@@ -32,6 +32,8 @@ import Pyro4
 # Pyro configuration. Use pickle because it can serialize numpy ndarrays.
 Pyro4.config.SERIALIZERS_ACCEPTED.add("pickle")
 Pyro4.config.SERIALIZER = "pickle"
+# Calls to devices are mostly small and latency sensitive.
+Pyro4.config.SOCK_NODELAY = True
 
 LISTENERS = {}
 
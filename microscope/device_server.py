@@ -70,6 +70,12 @@ if sys.platform == "darwin" and sys.version_info < (3, 8):
 Pyro4.config.SERIALIZERS_ACCEPTED.add("pickle")
 Pyro4.config.SERIALIZER = "pickle"
 
+# Most calls to devices are small and latency sensitive (triggers,
+# getting and setting of settings) so disable Nagle's algorithm.
+# This affects both the daemon sockets and the proxies to clients
+# used to dispatch data.
+Pyro4.config.SOCK_NODELAY = True
+
 # We effectively expose all attributes of the classes since our
 # devices don't hold any private data.  The private methods are to
 # signal an interface not meant for public usage, not because there's
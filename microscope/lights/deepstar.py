@@ -29,6 +29,55 @@ import microscope.abc
 _logger = logging.getLogger(__name__)
 
 
+def _pad(command: bytes) -> bytes:
+    """Pad command to the 16 bytes expected by the laser.
+
+    There's also a 7-byte mode but we never need to use it.  CR/LF
+    counts towards the byte limit, hence 14 (16-2).
+    """
+    return command.ljust(14) + b"\r\n"
+
+
+# Commands sent by DeepstarLaser, already padded.
+_PADDED_COMMANDS = {
+    command: _pad(command)
+    for command in [
+        b"S?",
+        b"STAT3",
+        b"LON",
+        b"L2",
+        b"IPO",
+        b"MF",
+        b"A2DF",
+        b"LF",
+        b"P?",
+        b"PP?",
+    ]
+}
+
+# The padded PP command for each of the 4096 power levels, indexed
+# by level, so that setting the power needs no formatting.
+_POWER_COMMANDS = [_pad(b"PP%03X" % level) for level in range(0x1000)]
+
+# The STAT0 to STAT3 commands, to query all status in a single write.
+_STATUS_QUERY = b"".join(_pad(b"STAT%d" % i) for i in range(4))
+
+# Commands to turn the laser on, and log message for their answers:
+# turn on deepstar mode with internal voltage ref, enable internal
+# peak power, set MF turns off internal digital and bias modulation,
+# and disable analog modulation to digital modulation.
+_ENABLE_COMMANDS = [
+    (b"LON", "Enable response: [%s]"),
+    (b"L2", "L2 response: [%s]"),
+    (b"IPO", "Enable-internal peak power response: [%s]"),
+    (b"MF", "MF response [%s]"),
+    (b"A2DF", "A2DF response [%s]"),
+]
+_ENABLE_SEQUENCE = b"".join(
+    _PADDED_COMMANDS[command] for command, msg in _ENABLE_COMMANDS
+)
+
+
 class DeepstarLaser(
     microscope.abc.SerialDeviceMixin, microscope.abc.LightSource
 ):
@@ -74,43 +123,36 @@ class DeepstarLaser(
 
     def _write(self, command):
         """Send a command."""
-        # We'll need to pad the command out to 16 bytes. There's also
-        # a 7-byte mode but we never need to use it.  CR/LF counts
-        # towards the byte limit, hence 14 (16-2)
-        command = command.ljust(14) + b"\r\n"
-        response = self.connection.write(command)
+        padded = _PADDED_COMMANDS.get(command)
+        if padded is None:
+            padded = _pad(command)
+        response = self.connection.write(padded)
         return response
 
     # Get the status of the laser, by sending the
     # STAT0, STAT1, STAT2, and STAT3 commands.
     @microscope.abc.SerialDeviceMixin.lock_comms
     def get_status(self):
-        result = []
-        for i in range(4):
-            self._write(("STAT%d" % i).encode())
-            result.append(self._readline().decode())
-        return result
+        # Send all commands at once and only then read the answers,
+        # instead of waiting for each answer before the next command.
+        self.connection.write(_STATUS_QUERY)
+        return [self._readline().decode() for _ in range(4)]
 
     # Turn the laser ON. Return True if we succeeded, False otherwise.
     @microscope.abc.SerialDeviceMixin.lock_comms
     def _do_enable(self):
         _logger.info("Turning laser ON.")
-        # Turn on deepstar mode with internal voltage ref
-        # Enable internal peak power
-        # Set MF turns off internal digital and bias modulation
-        # Disable analog modulation to digital modulation
-        for cmd, msg in [
-            (b"LON", "Enable response: [%s]"),
-            (b"L2", "L2 response: [%s]"),
-            (b"IPO", "Enable-internal peak power response: [%s]"),
-            (b"MF", "MF response [%s]"),
-            (b"A2DF", "A2DF response [%s]"),
-        ]:
-            self._write(cmd)
+        # Send all commands at once and only then read the answers.
+        self.connection.write(_ENABLE_SEQUENCE)
+        for cmd, msg in _ENABLE_COMMANDS:
             response = self._readline()
-            _logger.debug(msg, response.decode())
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(msg, response.decode())
 
-        if not self.get_is_on():
+        # The laser may send junk after some answers, so flush it
+        # before checking the state.
+        self.connection.reset_input_buffer()
+        if not self._get_is_on():
             # Something went wrong.
             self._write(b"S?")
             response = self._readline()
@@ -134,9 +176,14 @@ class DeepstarLaser(
     # to the laser being in S2 mode.
     @microscope.abc.SerialDeviceMixin.lock_comms
     def get_is_on(self):
+        return self._get_is_on()
+
+    def _get_is_on(self):
+        # Same as get_is_on, for use when comms are already locked.
         self._write(b"S?")
         response = self._readline()
-        _logger.debug("Are we on? [%s]", response.decode())
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Are we on? [%s]", response.decode())
         return response == b"S2"
 
     @microscope.abc.SerialDeviceMixin.lock_comms
@@ -144,14 +191,16 @@ class DeepstarLaser(
         _logger.debug("level=%d", power)
         power_int = int(power * 0xFFF)
         _logger.debug("power=%d", power_int)
-        strPower = "PP%03X" % power_int
-        _logger.debug("power level=%s", strPower)
-        self._write(strPower.encode())
+        command = _POWER_COMMANDS[power_int]
+        _logger.debug("power level=PP%03X", power_int)
+        self.connection.write(command)
         response = self._readline()
-        _logger.debug("Power response [%s]", response.decode())
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Power response [%s]", response.decode())
 
+    @microscope.abc.SerialDeviceMixin.lock_comms
     def _do_get_power(self) -> float:
-        if not self.get_is_on():
+        if not self._get_is_on():
             return 0.0
         if self._has_apc:
             query = b"P"
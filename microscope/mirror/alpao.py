@@ -18,6 +18,8 @@
 ## along with Microscope.  If not, see <http://www.gnu.org/licenses/>.
 
 import ctypes
+import threading
+import typing
 import warnings
 
 import numpy
@@ -32,6 +34,10 @@ except Exception as e:
     raise microscope.LibraryLoadError(e) from e
 
 
+# The SDK takes pointers to arrays of Scalar.
+_ASDK_SCALAR_DTYPE = numpy.dtype(asdk.Scalar)
+
+
 class AlpaoDeformableMirror(microscope.abc.DeformableMirror):
     """Alpao deformable mirror.
 
@@ -56,13 +62,23 @@ class AlpaoDeformableMirror(microscope.abc.DeformableMirror):
     ]
 
     @staticmethod
-    def _normalize_patterns(patterns: numpy.ndarray) -> numpy.ndarray:
+    def _normalize_patterns(
+        patterns: numpy.ndarray, out: typing.Optional[numpy.ndarray] = None
+    ) -> numpy.ndarray:
         """
         Alpao SDK expects values in the [-1 1] range, so we normalize
-        them from the [0 1] range we expect in our interface.
+        them from the [0 1] range we expect in our interface.  The
+        returned array is C contiguous and of the SDK `Scalar` type so
+        it can be passed directly to the SDK.  If `out` is given, the
+        normalized patterns are written there instead of a new array.
         """
-        patterns = (patterns * 2) - 1
-        return patterns
+        # Compute in place on a single array instead of allocating one
+        # for the multiplication and another for the subtraction.
+        normalized = numpy.multiply(
+            patterns, 2.0, out=out, dtype=_ASDK_SCALAR_DTYPE, order="C"
+        )
+        normalized -= 1.0
+        return normalized
 
     def _find_error_str(self) -> str:
         """Get an error string from the Alpao SDK error stack.
@@ -112,6 +128,12 @@ class AlpaoDeformableMirror(microscope.abc.DeformableMirror):
         self._n_actuators = int(value.contents.value)
         self._trigger_type = microscope.TriggerType.SOFTWARE
         self._trigger_mode = microscope.TriggerMode.ONCE
+        # Reused by queue_patterns while the patterns shape is the
+        # same.  The lock is held from filling it until it has been
+        # sent since queue_patterns may be called from multiple
+        # threads.
+        self._patterns_buffer = numpy.empty((0, 0), dtype=_ASDK_SCALAR_DTYPE)
+        self._patterns_lock = threading.Lock()
 
     @property
     def n_actuators(self) -> int:
@@ -147,9 +169,8 @@ class AlpaoDeformableMirror(microscope.abc.DeformableMirror):
             )
         self._trigger_mode = tmode
 
-        try:
-            value = self._TriggerType_to_asdkTriggerIn[ttype]
-        except KeyError:
+        value = self._TriggerType_to_asdkTriggerIn.get(ttype)
+        if value is None:
             raise microscope.UnsupportedFeatureError(
                 "unsupported trigger of type '%s' for Alpao Mirrors"
                 % ttype.name
@@ -164,8 +185,8 @@ class AlpaoDeformableMirror(microscope.abc.DeformableMirror):
             return
 
         self._validate_patterns(patterns)
-        patterns = self._normalize_patterns(patterns)
-        patterns = numpy.atleast_2d(patterns)
+        if patterns.ndim == 1:
+            patterns = patterns.reshape(1, -1)
         n_patterns: int = patterns.shape[0]
 
         # The Alpao SDK seems to only support the trigger mode start.  It
@@ -187,20 +208,34 @@ class AlpaoDeformableMirror(microscope.abc.DeformableMirror):
                 % (self._trigger_type.name, self._trigger_mode.name)
             )
 
-        data_pointer = patterns.ctypes.data_as(asdk.Scalar_p)
+        with self._patterns_lock:
+            if self._patterns_buffer.shape != patterns.shape:
+                self._patterns_buffer = numpy.empty(
+                    patterns.shape, dtype=_ASDK_SCALAR_DTYPE
+                )
+            patterns = self._normalize_patterns(
+                patterns, self._patterns_buffer
+            )
+            data_pointer = patterns.ctypes.data_as(asdk.Scalar_p)
 
-        # We don't know if the previous queue of pattern ran until the
-        # end, so we need to clear it before sending (see issue #50)
-        status = asdk.Stop(self._dm)
-        self._raise_if_error(status)
+            # We don't know if the previous queue of pattern ran until
+            # the end, so we need to clear it before sending (see
+            # issue #50)
+            status = asdk.Stop(self._dm)
+            self._raise_if_error(status)
 
-        status = asdk.SendPattern(
-            self._dm, data_pointer, n_patterns, n_repeats
-        )
-        self._raise_if_error(status)
+            status = asdk.SendPattern(
+                self._dm, data_pointer, n_patterns, n_repeats
+            )
+            self._raise_if_error(status)
 
     def _do_shutdown(self) -> None:
+        # Device.__del__ calls shutdown again if it was already called
+        # explicitly, and the DM must not be released twice.
+        if self._dm is None:
+            return
         status = asdk.Release(self._dm)
+        self._dm = None
         if status != asdk.SUCCESS:
             msg = self._find_error_str()
             warnings.warn(msg)
@@ -294,6 +294,7 @@ class SimulatedCamera(
         )
         if self._acquiring:
             self._triggered += 1
+            self._data_ready.set()
 
     def _get_binning(self):
         return self._binning
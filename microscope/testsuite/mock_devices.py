@@ -541,8 +541,13 @@ class OmicronDeepstarLaserMock(SerialMock):
         # This connection does not wait for an eol to parse the
         # command.  It only looks at 16 or 7 bit (depending on
         # state).  Sending a message one character at a time will not
-        # work so just send the whole data to be handled.
-        self.handle(data)
+        # work so just send the whole data to be handled.  Multiple
+        # 16 byte commands may be sent in a single write though.
+        if len(data) > 16 and len(data) % 16 == 0:
+            for i in range(0, len(data), 16):
+                self.handle(data[i : i + 16])
+        else:
+            self.handle(data)
         return len(data)
 
     def handle(self, command):
@@ -35,6 +35,7 @@ constructs the device instance required to run the tests.
 
 """
 
+import itertools
 import unittest
 import unittest.mock
 from queue import Queue
@@ -247,7 +248,21 @@ class LightSourceTests(DeviceTests):
 
 
 class CameraTests(DeviceTests):
-    pass
+    def test_process_data_transform(self):
+        data = numpy.arange(6 * 4).reshape(6, 4)
+        flips = {
+            (False, False): lambda d: d,
+            (False, True): numpy.flipud,
+            (True, False): numpy.fliplr,
+            (True, True): lambda d: numpy.fliplr(numpy.flipud(d)),
+        }
+        for lr, ud, rot in itertools.product([False, True], repeat=3):
+            with self.subTest(lr=lr, ud=ud, rot=rot):
+                self.device.set_transform((lr, ud, rot))
+                expected = flips[(lr, ud)](numpy.rot90(data, rot))
+                numpy.testing.assert_array_equal(
+                    self.device._process_data(data), expected
+                )
 
 
 class ControllerTests(DeviceTests):
@@ -418,11 +433,32 @@ class TestOmicronDeepstarLaser(
         self.assertFalse(self.device.connection.digital_modulation)
         self.assertFalse(self.device.connection.analog2digital)
 
+    def test_status_order(self):
+        # All STAT queries are sent at once, so check the answers are
+        # still read back in order.
+        status = self.device.get_status()
+        self.assertEqual(len(status), 4)
+        self.assertTrue(status[0].startswith("MC"))
+        self.assertTrue(status[1].startswith("SL"))
+        self.assertTrue(status[2].startswith("R"))
+        self.assertTrue(status[3].startswith("OC"))
+
 
 class TestDummyCamera(unittest.TestCase, CameraTests):
     def setUp(self):
         self.device = simulators.SimulatedCamera()
 
+    def test_same_client_pushed_twice(self):
+        client = Queue()
+        self.device.set_client(client)
+        self.device.set_client(client)
+        self.device.set_client(None)
+        self.assertIn(client, self.device._liveClients)
+        self.assertIs(self.device._client, client)
+        self.device.set_client(None)
+        self.assertNotIn(client, self.device._liveClients)
+        self.assertIsNone(self.device._client)
+
 
 class TestImageGenerator(unittest.TestCase):
     def test_non_square_patterns_shape(self):
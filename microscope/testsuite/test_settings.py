@@ -20,6 +20,7 @@
 """Tests for the microscope devices settings.
 """
 
+import copy
 import enum
 import unittest
 
@@ -49,7 +50,7 @@ def create_enum_setting(default, with_getter=True, with_setter=True):
     thing = ThingWithSomething(EnumSetting(default))
     getter = thing.get_val if with_getter else None
     setter = thing.set_val if with_setter else None
-    setting = microscope.abc._Setting(
+    setting = microscope.abc._make_setting(
         "foobar", "enum", get_func=getter, set_func=setter, values=EnumSetting
     )
     return setting, thing
@@ -76,6 +77,96 @@ class TestEnumSetting(unittest.TestCase):
         self.assertEqual(setting.get(), 2)
         self.assertEqual(EnumSetting(2), thing.val)
 
+    def test_write_only_is_cached(self):
+        """describe() reports write-only settings as cached once set"""
+        setting, thing = create_enum_setting(1, with_getter=False)
+        self.assertFalse(setting.describe()["cached"])
+        setting.set(2)
+        self.assertTrue(setting.describe()["cached"])
+
+
+class TestSettingValues(unittest.TestCase):
+    def test_values_from_function_are_not_cached(self):
+        """values() calls the values function each time"""
+        thing = ThingWithSomething(0)
+        limits = [(0, 10)]
+        setting = microscope.abc._Setting(
+            "foobar",
+            "int",
+            thing.get_val,
+            thing.set_val,
+            values=lambda: limits[0],
+        )
+        self.assertEqual(setting.values(), (0, 10))
+        limits[0] = (0, 20)
+        self.assertEqual(setting.values(), (0, 20))
+
+    def test_enum_values(self):
+        setting, thing = create_enum_setting(1)
+        self.assertEqual(setting.values(), [(0, "A"), (1, "B"), (2, "C")])
+        self.assertEqual(setting.describe()["values"], setting.values())
+
+    def test_constant_values_not_modifiable(self):
+        """Changing the values returned does not change the setting"""
+        setting, thing = create_enum_setting(1)
+        setting.values().append((3, "D"))
+        self.assertEqual(setting.describe()["values"], setting.values())
+        self.assertEqual(setting.values(), [(0, "A"), (1, "B"), (2, "C")])
+
+    def test_setting_without_getter(self):
+        """Settings without get function must be write-only settings"""
+        with self.assertRaises(ValueError):
+            microscope.abc._Setting("foobar", "int", None, print, (0, 10))
+        setting = microscope.abc._make_setting(
+            "foobar", "int", None, print, (0, 10)
+        )
+        self.assertIsInstance(setting, microscope.abc._WriteOnlySetting)
+
+    def test_copy(self):
+        """Settings can be copied"""
+        setting, thing = create_enum_setting(1)
+        self.assertEqual(copy.copy(setting).values(), setting.values())
+
+
+class DeviceWithSettings(microscope.abc.Device):
+    def __init__(self):
+        super().__init__()
+        self.foo = ThingWithSomething(1)
+        self.bar = ThingWithSomething(2)
+        self.add_setting(
+            "foo", "int", self.foo.get_val, self.foo.set_val, (0, 10)
+        )
+        self.add_setting(
+            "bar", "int", self.bar.get_val, self.bar.set_val, (0, 10)
+        )
+        self.add_setting("baz", "int", lambda: 3, None, (0, 10))
+
+    def _do_shutdown(self) -> None:
+        pass
+
+
+class TestUpdateSettings(unittest.TestCase):
+    def setUp(self):
+        self.device = DeviceWithSettings()
+
+    def test_only_changed_settings(self):
+        """update_settings sets and reads back only changed settings"""
+        results = self.device.update_settings({"foo": 5, "bar": 2})
+        self.assertEqual(results, {"foo": 5})
+        self.assertEqual(self.device.foo.val, 5)
+
+    def test_readonly_settings_are_read_back(self):
+        results = self.device.update_settings({"foo": 5, "baz": 4})
+        self.assertEqual(results, {"foo": 5, "baz": 3})
+
+    def test_init_requires_all_settings(self):
+        with self.assertRaisesRegex(Exception, "missing keys: baz"):
+            self.device.update_settings({"foo": 5, "bar": 2}, init=True)
+        results = self.device.update_settings(
+            {"foo": 5, "bar": 2, "baz": 3}, init=True
+        )
+        self.assertEqual(results, {"foo": 5, "bar": 2, "baz": 3})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -131,10 +131,10 @@ setuptools.setup(
     python_requires=">=3.7",
     install_requires=[
         "Pillow",
-        "Pyro4",
+        "Pyro4>=4.36",  # SOCK_NODELAY option
         "hidapi",
         "numpy",
-        "pyserial",
+        "pyserial>=3.0",  # reset_input_buffer
         "scipy",
     ],
     extras_require={"GUI": ["PySide2"]},